@@ -22,59 +22,68 @@ fan_probs     = np.array([0.10,0.13,0.25,0.13,0.09,0.12,0.02,0.06,0.05,0.05])
 arrival_delays = np.array([20, 30, 45])
 delay_probs    = np.array([0.60,0.30,0.10])
 
+# Cumulative probabilities for inverse-CDF sampling (last bin pinned to 1.0)
+fan_cdf   = np.cumsum(fan_probs);   fan_cdf[-1]   = 1.0
+delay_cdf = np.cumsum(delay_probs); delay_cdf[-1] = 1.0
+
 num_failures = 45
 
 # ─── 2. SIMULATION FUNCTION ─────────────────────────────────────────────────────
-def simulate(policy):
-    print(f"\n=== SIMULATING POLICY: {policy.upper()} ===")
-    total_cost = 0.0
-
-    for i in range(1, num_failures + 1):
-        # --- Sample random variables ---
-        life = np.random.choice(fan_lifetimes, p=fan_probs)   # hours until failure
-        delay = np.random.choice(arrival_delays, p=delay_probs)  # min until tech arrives
-
-        # --- Policy-specific parameters ---
-        rep_time = replacement_time[policy]
-        n_fans   = fans_replaced[policy]
+def simulate(policy, rng, verbose=False):
+    # --- Sample random variables (all events at once) ---
+    u_life, u_delay = rng.random((2, num_failures))
+    life  = fan_lifetimes[np.searchsorted(fan_cdf, u_life, side='right')]       # hours until failure
+    delay = arrival_delays[np.searchsorted(delay_cdf, u_delay, side='right')]  # min until tech arrives
 
-        # --- Cost components ---
-        rep_cost       = n_fans * fan_cost
-        downtime       = delay + rep_time
-        dt_cost        = downtime * downtime_cost_per_min
-        labor_time_hr  = rep_time / 60.0
-        labor_cost     = labor_time_hr * labor_cost_per_hr
-        event_cost     = rep_cost + dt_cost + labor_cost
+    # --- Policy-specific parameters ---
+    rep_time = replacement_time[policy]
+    n_fans   = fans_replaced[policy]
 
-        # --- Debug prints for this event ---
-        print(f"\nEvent #{i}")
-        print(f"  Sampled fan lifetime   : {life} hrs")
-        print(f"  Technician delay       : {delay} min")
-        print(f"  Fans replaced          : {n_fans}")
-        print(f"  Replacement time       : {rep_time} min")
-        print(f"  Replacement cost       : ${rep_cost:.2f}")
-        print(f"  Downtime total         : {downtime} min")
-        print(f"  Downtime cost          : ${dt_cost:.2f}")
-        print(f"  Labour time            : {labor_time_hr:.2f} hr")
-        print(f"  Labour cost            : ${labor_cost:.2f}")
-        print(f"  → Event total cost     : ${event_cost:.2f}")
+    # --- Cost components ---
+    rep_cost       = n_fans * fan_cost
+    downtime       = delay + rep_time
+    dt_cost        = downtime * downtime_cost_per_min
+    labor_time_hr  = rep_time / 60.0
+    labor_cost     = labor_time_hr * labor_cost_per_hr
+    event_cost     = rep_cost + dt_cost + labor_cost
+    total_cost     = event_cost.sum()
 
-        total_cost += event_cost
+    # --- Per-event breakdown, written in a single call ---
+    if verbose:
+        lines = [f"\n=== SIMULATING POLICY: {policy.upper()} ==="]
+        for i in range(num_failures):
+            lines += [
+                f"\nEvent #{i + 1}",
+                f"  Sampled fan lifetime   : {life[i]} hrs",
+                f"  Technician delay       : {delay[i]} min",
+                f"  Fans replaced          : {n_fans}",
+                f"  Replacement time       : {rep_time} min",
+                f"  Replacement cost       : ${rep_cost:.2f}",
+                f"  Downtime total         : {downtime[i]} min",
+                f"  Downtime cost          : ${dt_cost[i]:.2f}",
+                f"  Labour time            : {labor_time_hr:.2f} hr",
+                f"  Labour cost            : ${labor_cost:.2f}",
+                f"  → Event total cost     : ${event_cost[i]:.2f}",
+            ]
+        lines.append(f"\n→ TOTAL COST ({policy}): ${total_cost:.2f}")
+        print("\n".join(lines))
 
-    print(f"\n→ TOTAL COST ({policy}): ${total_cost:.2f}")
     return total_cost
 
 # ─── 3. MAIN EXECUTION ────────────────────────────────────────────────────────────
 if __name__ == "__main__":
-    np.random.seed(123)   # for reproducibility
+    rng = np.random.default_rng(123)   # for reproducibility
+    verbose = False                    # True prints every event's breakdown
 
     # Run both policies
-    cost_current  = simulate('current')
-    cost_proposed = simulate('proposed')
+    cost_current  = simulate('current', rng, verbose)
+    cost_proposed = simulate('proposed', rng, verbose)
 
     # Summary
-    print("\n" + "="*40)
-    print(f"Summary of 45 failures:")
-    print(f"  Current policy cost : ${cost_current:.2f}")
-    print(f"  Proposed policy cost: ${cost_proposed:.2f}")
-    print("="*40)
+    print("\n".join([
+        "\n" + "="*40,
+        f"Summary of {num_failures} failures:",
+        f"  Current policy cost : ${cost_current:.2f}",
+        f"  Proposed policy cost: ${cost_proposed:.2f}",
+        "="*40,
+    ]))
@@ -3,9 +3,12 @@
 import streamlit as st
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 from scipy.stats import ttest_ind, ttest_rel
 
+from engine import (LIFETIMES, LIFETIME_PROBS, DELAYS, DELAY_PROBS,
+                    simulate_total, simulate_rate)
+
 # -----------------------------
 # 1. Page & Sidebar Inputs
 # -----------------------------
@@ -35,25 +38,20 @@ REPLACEMENT_TIME = {1: rt1, 2: rt2, 3: rt3}
 # -----------------------------
 # Table 1: operational life distribution
 LIFETIME_DISTS = pd.DataFrame({
-    "Lifetime (hrs)": [1000, 1100, 1200, 1300, 1400, 
-                       1500, 1600, 1700, 1800, 1900],
-    "Probability":    [0.10,  0.13,  0.25,  0.13,  0.09,
-                       0.12,  0.02,  0.06,  0.05,  0.05]
+    "Lifetime (hrs)": LIFETIMES,
+    "Probability":    LIFETIME_PROBS
 })
 
 # Table 2: technician arrival time distribution
 DELAY_DISTS = pd.DataFrame({
-    "Delay (min)": [20, 30, 45],
-    "Probability": [0.60, 0.30, 0.10]
+    "Delay (min)": DELAYS,
+    "Probability": DELAY_PROBS
 })
 
 # Sidebar note
 st.sidebar.markdown("---")
 st.sidebar.write("Fan‐life and delay distributions updated per user request.")
 
-# Seed RNG
-np.random.seed(int(seed))
-
 # Show distributions and bar charts
 st.subheader("Input Distributions")
 
@@ -61,32 +59,34 @@ col1, col2 = st.columns(2)
 with col1:
     st.markdown("**Fan Lifetime Distribution**")
     st.table(LIFETIME_DISTS)
-    fig_life, ax_life = plt.subplots()
-    ax_life.bar(LIFETIME_DISTS["Lifetime (hrs)"], LIFETIME_DISTS["Probability"])
-    ax_life.set_xlabel("Lifetime (hrs)")
-    ax_life.set_ylabel("Probability")
-    ax_life.set_title("Fan Lifetime Distribution")
-    st.pyplot(fig_life)
+    st.bar_chart(LIFETIME_DISTS.set_index("Lifetime (hrs)"))
 
 with col2:
     st.markdown("**Technician Delay Distribution**")
     st.table(DELAY_DISTS)
-    fig_delay, ax_delay = plt.subplots()
-    ax_delay.bar(DELAY_DISTS["Delay (min)"], DELAY_DISTS["Probability"])
-    ax_delay.set_xlabel("Delay (min)")
-    ax_delay.set_ylabel("Probability")
-    ax_delay.set_title("Technician Delay Distribution")
-    st.pyplot(fig_delay)
+    st.bar_chart(DELAY_DISTS.set_index("Delay (min)"))
 
 # -----------------------------
-# 3. Cost Calculation Helper
+# 3. Cached Simulations
 # -----------------------------
-def calculate_costs(downtime_min, num_fans):
-    labor_cost    = (downtime_min / 60) * LABOR_RATE
-    fan_cost      = num_fans * FAN_COST
-    downtime_cost = downtime_min * DOWNTIME_RATE
-    total_cost    = labor_cost + fan_cost + downtime_cost
-    return total_cost, labor_cost, fan_cost, downtime_cost
+# The Monte Carlo kernels live in engine.py. These wrappers take the seed
+# instead of a Generator so that results are cached on plain inputs and
+# reruns triggered by unrelated widgets reuse the previous arrays.
+
+@st.cache_data(show_spinner=False)
+def cached_total(seed, n_trials, n_fail,
+                 fan_cost, downtime_rate, labor_rate, replacement_time):
+    return simulate_total(np.random.default_rng(seed), n_trials, n_fail,
+                          fan_cost, downtime_rate, labor_rate, replacement_time)
+
+@st.cache_data(show_spinner=False)
+def cached_rates(seed, n_trials, n_fail,
+                 fan_cost, downtime_rate, labor_rate, replacement_time):
+    return simulate_rate(np.random.default_rng(seed), n_trials, n_fail,
+                         fan_cost, downtime_rate, labor_rate, replacement_time)
+
+SIM_ARGS = (int(seed), int(n_trials), int(n_fail),
+            FAN_COST, DOWNTIME_RATE, LABOR_RATE, REPLACEMENT_TIME)
 
 # -----------------------------
 # 4. Tabbed Layout
@@ -102,26 +102,7 @@ tab1, tab2 = st.tabs([
 with tab1:
     st.header("Policy Comparison: Total Cost over 45 Failures")
 
-    def run_total_policy(replace_count):
-        costs = []
-        for _ in range(int(n_trials)):
-            cum_cost = 0.0
-            for _ in range(int(n_fail)):
-                # draw one lifetime (we're not tracking aging here)
-                _       = np.random.choice(
-                              LIFETIME_DISTS["Lifetime (hrs)"],
-                              p=LIFETIME_DISTS["Probability"])
-                delay   = np.random.choice(
-                              DELAY_DISTS["Delay (min)"],
-                              p=DELAY_DISTS["Probability"])
-                downtime = delay + REPLACEMENT_TIME[replace_count]
-                c, lc, fc, dc = calculate_costs(downtime, replace_count)
-                cum_cost += c
-            costs.append(cum_cost)
-        return np.array(costs)
-
-    curr_total = run_total_policy(1)
-    prop_total = run_total_policy(3)
+    curr_total, prop_total = cached_total(*SIM_ARGS)
 
     # Averages & bar chart
     avg_table = pd.DataFrame({
@@ -131,19 +112,21 @@ with tab1:
     st.write("**Average Total Cost**")
     st.table(avg_table)
 
-    fig_avg, ax_avg = plt.subplots()
+    fig_avg = Figure()
+    ax_avg = fig_avg.subplots()
     ax_avg.bar(avg_table.index, avg_table["Avg Total Cost ($)"])
     ax_avg.set_ylabel("Average Cost ($)")
     ax_avg.set_title("Average Total Cost by Policy")
     st.pyplot(fig_avg)
 
     # Histograms
-    fig_h, (ax1h, ax2h) = plt.subplots(1,2, figsize=(8,3))
-    ax1h.hist(curr_total, bins=30)
+    fig_h = Figure(figsize=(8,3))
+    ax1h, ax2h = fig_h.subplots(1,2)
+    ax1h.stairs(*np.histogram(curr_total, bins=30), fill=True)
     ax1h.set_title("Current Policy Costs")
     ax1h.set_xlabel("Total Cost ($)")
     ax1h.set_ylabel("Frequency")
-    ax2h.hist(prop_total, bins=30)
+    ax2h.stairs(*np.histogram(prop_total, bins=30), fill=True)
     ax2h.set_title("Proposed Policy Costs")
     ax2h.set_xlabel("Total Cost ($)")
     ax2h.set_ylabel("Frequency")
@@ -164,38 +147,7 @@ with tab1:
 with tab2:
     st.header("Policy Comparison: Cost per Hour (Continuous Aging + CRN)")
 
-    rs = np.random.RandomState(int(seed))
-
-    def simulate_rate_trial(replace_all):
-        lives = rs.choice(
-                    LIFETIME_DISTS["Lifetime (hrs)"], size=3,
-                    p=LIFETIME_DISTS["Probability"]).astype(float)
-        total_hours = 0.0
-        total_cost  = 0.0
-        for _ in range(int(n_fail)):
-            t_fail = lives.min()
-            total_hours += t_fail
-            lives -= t_fail
-            next_lives = rs.choice(
-                             LIFETIME_DISTS["Lifetime (hrs)"], size=3,
-                             p=LIFETIME_DISTS["Probability"]).astype(float)
-            delay = rs.choice(
-                        DELAY_DISTS["Delay (min)"],
-                        p=DELAY_DISTS["Probability"])
-            if replace_all:
-                num = 3
-                lives = next_lives.copy()
-            else:
-                num = 1
-                idx = np.argmin(lives)
-                lives[idx] = next_lives[0]
-            downtime = delay + REPLACEMENT_TIME[num]
-            c, *_    = calculate_costs(downtime, num)
-            total_cost += c
-        return total_cost / total_hours
-
-    rates_curr = np.array([simulate_rate_trial(False) for _ in range(int(n_trials))])
-    rates_prop = np.array([simulate_rate_trial(True)  for _ in range(int(n_trials))])
+    rates_curr, rates_prop = cached_rates(*SIM_ARGS)
 
     # Average rates table & bar chart
     rate_table = pd.DataFrame({
@@ -205,14 +157,16 @@ with tab2:
     st.write("**Average Cost per Hour**")
     st.table(rate_table)
 
-    fig_rate, ax_rate = plt.subplots()
+    fig_rate = Figure()
+    ax_rate = fig_rate.subplots()
     ax_rate.bar(rate_table.index, rate_table["Avg Cost per Hour ($/hr)"])
     ax_rate.set_ylabel("Cost per Hour ($/hr)")
     ax_rate.set_title("Average Cost Rate by Policy")
     st.pyplot(fig_rate)
 
     # Boxplot of rates
-    fig_box, ax_box = plt.subplots()
+    fig_box = Figure()
+    ax_box = fig_box.subplots()
     ax_box.boxplot([rates_curr, rates_prop], labels=["Current", "Proposed"])
     ax_box.set_ylabel("Cost per Hour ($/hr)")
     ax_box.set_title("Cost Rate Distribution")
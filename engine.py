@@ -0,0 +1,150 @@
+# engine.py
+# Vectorized Monte Carlo engine for the cooling fan replacement policies.
+# Free of Streamlit so the kernels live in one importable place; the app
+# adds caching on top.
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+# -----------------------------
+# 1. Distributions
+# -----------------------------
+# Table 1: operational life distribution
+LIFETIMES      = np.array([1000, 1100, 1200, 1300, 1400,
+                           1500, 1600, 1700, 1800, 1900])
+LIFETIME_PROBS = np.array([0.10,  0.13,  0.25,  0.13,  0.09,
+                           0.12,  0.02,  0.06,  0.05,  0.05])
+
+# Table 2: technician arrival time distribution
+DELAYS      = np.array([20, 30, 45])
+DELAY_PROBS = np.array([0.60, 0.30, 0.10])
+
+# float32 copies of the values for the simulation kernels
+LIFETIME_VALS = LIFETIMES.astype(np.float32)
+DELAY_VALS    = DELAYS.astype(np.float32)
+
+# Cumulative probabilities for inverse-CDF sampling (last bin pinned to 1.0),
+# in float32 to match the uniforms they are compared against
+LIFETIME_CDF = np.cumsum(LIFETIME_PROBS).astype(np.float32)
+LIFETIME_CDF[-1] = 1.0
+DELAY_CDF = np.cumsum(DELAY_PROBS).astype(np.float32)
+DELAY_CDF[-1] = 1.0
+
+# Map float32 uniforms to row indices of a distribution table (10 and 3
+# rows, so uint8 is plenty) by inverting its CDF
+def cdf_index(cdf, u):
+    return np.searchsorted(cdf, u, side="right").astype(np.uint8)
+
+# -----------------------------
+# 2. Kernels
+# -----------------------------
+# Trials per work unit. Larger runs are split into chunks of this size,
+# each with its own child Generator, and evaluated on a thread pool:
+# NumPy releases the GIL inside its array kernels, and the chunking also
+# caps the size of the per-event arrays. The split does not depend on
+# the number of workers, so results stay reproducible for a given seed.
+TRIAL_CHUNK = 25_000
+
+def run_in_chunks(kernel, rng, n_trials, *args):
+    if n_trials <= TRIAL_CHUNK:
+        return kernel(rng, n_trials, *args)
+    sizes = [min(TRIAL_CHUNK, n_trials - i)
+             for i in range(0, n_trials, TRIAL_CHUNK)]
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+        parts = list(pool.map(lambda r, n: kernel(r, n, *args),
+                              rng.spawn(len(sizes)), sizes))
+    return tuple(np.concatenate(p) for p in zip(*parts))
+
+# Cost of one failure event for each technician delay in DELAY_VALS.
+# Everything except the delay is fixed per policy, so the per-event cost
+# is a lookup into this table by delay index.
+def event_cost_table(num_fans, rep_time, fan_cost, downtime_rate, labor_rate):
+    per_min  = downtime_rate + labor_rate / 60    # downtime and labour, $/min
+    constant = num_fans * fan_cost + rep_time * per_min
+    return (constant + DELAY_VALS * per_min).astype(np.float32)
+
+# Both policies in one pass. Tab 1 compares them with a two-sample test,
+# so each policy gets its own delay sample (leading axis of the draw).
+def run_total_policies(rng, n_trials, n_fail,
+                       fan_cost, downtime_rate, labor_rate, replacement_time):
+    # only delays matter here: lifetimes are not tracked without aging
+    delay_ix = cdf_index(DELAY_CDF,
+                         rng.random((2, n_trials, n_fail), dtype=np.float32))
+    costs    = fan_cost, downtime_rate, labor_rate
+    cost_1   = event_cost_table(1, replacement_time[1], *costs)
+    cost_3   = event_cost_table(3, replacement_time[3], *costs)
+    return (cost_1[delay_ix[0]].sum(axis=1, dtype=np.float64),
+            cost_3[delay_ix[1]].sum(axis=1, dtype=np.float64))
+
+# Minimum over the last (fan) axis of length 3. Elementwise np.minimum on
+# the three columns is much faster than a min(axis=-1) reduction.
+def min_of_3(a):
+    return np.minimum(np.minimum(a[..., 0], a[..., 1]), a[..., 2])
+
+# Hours elapsed over the failures, stepping every trial's three fan lives
+# at once. replace_all swaps in a whole fresh row at each failure, so the
+# time to each failure is just the minimum of the row in service and no
+# stepping is needed; otherwise only the failed fan gets the first
+# replacement life.
+def aging_hours(lives, next_lives, replace_all):
+    if replace_all:
+        return (min_of_3(lives)
+                + min_of_3(next_lives[:, :-1]).sum(axis=1, dtype=np.float64))
+    # each fan's remaining life is kept as its own contiguous column, so a
+    # step is a few 1-D passes instead of argmin, a gather and a scatter
+    # over the (n_trials, 3) array
+    c0, c1, c2 = (lives[:, k].copy() for k in range(3))
+    replacements = np.ascontiguousarray(next_lives[:, :, 0].T)
+    total_hours = np.zeros(len(lives))
+    for new in replacements:
+        t_fail = np.minimum(np.minimum(c0, c1), c2)
+        total_hours += t_fail
+        c0 -= t_fail
+        c1 -= t_fail
+        c2 -= t_fail
+        # the failed fan is the first one left at exactly zero, matching argmin
+        z0 = c0 == 0
+        z1 = (c1 == 0) & ~z0
+        np.copyto(c0, new, where=z0)
+        np.copyto(c1, new, where=z1)
+        np.copyto(c2, new, where=~(z0 | z1))
+    return total_hours
+
+# Both policies on common random numbers: the initial lives, replacement
+# lives and technician delays are drawn once and shared.
+def run_rate_policies(rng, n_trials, n_fail,
+                      fan_cost, downtime_rate, labor_rate, replacement_time):
+    # one row of uniforms per trial: 3 initial lives, then per failure
+    # 3 replacement lives followed by 1 technician delay
+    u = rng.random((n_trials, 3 + 4 * n_fail), dtype=np.float32)
+    steps = u[:, 3:].reshape(n_trials, n_fail, 4)
+    lives = LIFETIME_VALS[cdf_index(LIFETIME_CDF, u[:, :3])]
+    next_lives = LIFETIME_VALS[cdf_index(LIFETIME_CDF, steps[:, :, :3])]
+    delay_ix = cdf_index(DELAY_CDF, steps[:, :, 3])
+
+    # event costs do not depend on aging, so they are summed at once
+    costs  = fan_cost, downtime_rate, labor_rate
+    cost_1 = event_cost_table(1, replacement_time[1], *costs)
+    cost_3 = event_cost_table(3, replacement_time[3], *costs)
+    curr = cost_1[delay_ix].sum(axis=1, dtype=np.float64)
+    prop = cost_3[delay_ix].sum(axis=1, dtype=np.float64)
+    return (curr / aging_hours(lives, next_lives, False),
+            prop / aging_hours(lives, next_lives, True))
+
+# -----------------------------
+# 3. Entry Points
+# -----------------------------
+# Per-trial (current, proposed) total cost over n_fail failures.
+def simulate_total(rng, n_trials, n_fail,
+                   fan_cost, downtime_rate, labor_rate, replacement_time):
+    return run_in_chunks(run_total_policies, rng, n_trials, n_fail,
+                         fan_cost, downtime_rate, labor_rate, replacement_time)
+
+# Per-trial (current, proposed) cost per operational hour with
+# continuous aging and common random numbers.
+def simulate_rate(rng, n_trials, n_fail,
+                  fan_cost, downtime_rate, labor_rate, replacement_time):
+    return run_in_chunks(run_rate_policies, rng, n_trials, n_fail,
+                         fan_cost, downtime_rate, labor_rate, replacement_time)